@@ -859,6 +859,9 @@ class FMIndex : public SuffixArrayInterface
                 throw std::runtime_error( "File opening error: " + rxFileNamePrefix + ".bwt" );
             } // if
 
+            // the suffix array is read in the background, while the BWT is restored
+            prefetchFile( rxFileNamePrefix + ".sa" );
+
             std::ifstream xInputFiletream( rxFileNamePrefix + ".bwt", std::ios::binary | std::ios::in );
             if( xInputFiletream.fail( ) ) // check whether we could successfully open the stream
             {
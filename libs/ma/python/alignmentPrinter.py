@@ -51,6 +51,13 @@ class AlignmentPrinter(Module):
 
         atLeastOneMistake = False
 
+        # compare plain ints in the loop instead of going through the enum's __eq__ for every element
+        MATCH = int(MatchType.match)
+        SEED = int(MatchType.seed)
+        MISSMATCH = int(MatchType.missmatch)
+        INSERTION = int(MatchType.insertion)
+        DELETION = int(MatchType.deletion)
+
         while counter < len(align):
             #append three more lines if the current lines are full
             if counter % self.nuc_per_line == 0:
@@ -61,41 +68,45 @@ class AlignmentPrinter(Module):
                                                     self.nuc_per_line)
                     lines.extend(["", desc, "", "", ""])
 
+            # fetch the element once; each align[...] goes through the bindings
+            match_type = align[counter]
+            code = int(match_type)
+
             #perform double check for messup:
-            if ind_ref >= len(ref) and (align[counter] == MatchType.match
-                                        or align[counter] == MatchType.seed or
-                                        align[counter] == MatchType.deletion or
-                                        align[counter] == MatchType.missmatch):
+            if ind_ref >= len(ref) and (code == MATCH
+                                        or code == SEED or
+                                        code == DELETION or
+                                        code == MISSMATCH):
                 print("This should not happen... (ref)")
-                print(align[counter])
+                print(match_type)
                 print(ind_ref)
                 print(len(ref))
                 # @todo it would be nice if the cpp code would simply support slicing the alignment
                 s = []
                 for index in range(counter, len(align)):
-                    s.append(align[counter])
+                    s.append(match_type)
                 print("remaining cigar:", s)
                 atLeastOneMistake = True
                 break
             if ind_query >= len(query) and (
-                    align[counter] == MatchType.match
-                    or align[counter] == MatchType.seed
-                    or align[counter] == MatchType.insertion
-                    or align[counter] == MatchType.missmatch):
+                    code == MATCH
+                    or code == SEED
+                    or code == INSERTION
+                    or code == MISSMATCH):
                 print("This should not happen... (query)")
-                print(align[counter])
+                print(match_type)
                 print(ind_query)
                 print(len(query))
                 s = []
                 for index in range(counter, len(align)):
-                    s.append(align[counter])
+                    s.append(match_type)
                 print("remaining cigar:", s)
                 atLeastOneMistake = True
                 break
 
             #check for match or missmatch
             #print str(ind_ref) + " of " + str(align.end_on_ref() - align.begin_on_ref())
-            if align[counter] == MatchType.match:
+            if code == MATCH:
                 if ref[ind_ref] != query[ind_query]:
                     lines[-2] += 'x'
                     atLeastOneMistake = True
@@ -105,7 +116,7 @@ class AlignmentPrinter(Module):
                 lines[-1] += query[ind_query]
                 ind_ref += 1
                 ind_query += 1
-            elif align[counter] == MatchType.seed:
+            elif code == SEED:
                 if ref[ind_ref] != query[ind_query]:
                     lines[-2] += 'X'
                     atLeastOneMistake = True
@@ -115,7 +126,7 @@ class AlignmentPrinter(Module):
                 lines[-1] += query[ind_query]
                 ind_ref += 1
                 ind_query += 1
-            elif align[counter] == MatchType.missmatch:
+            elif code == MISSMATCH:
                 if ref[ind_ref] == query[ind_query]:
                     lines[-2] += ':'
                     atLeastOneMistake = True
@@ -125,18 +136,18 @@ class AlignmentPrinter(Module):
                 lines[-1] += query[ind_query]
                 ind_ref += 1
                 ind_query += 1
-            elif align[counter] == MatchType.insertion:
+            elif code == INSERTION:
                 lines[-3] += '-'
                 lines[-2] += ' '
                 lines[-1] += query[ind_query]
                 ind_query += 1
-            elif align[counter] == MatchType.deletion:
+            elif code == DELETION:
                 lines[-3] += ref[ind_ref]
                 lines[-2] += ' '
                 lines[-1] += '-'
                 ind_ref += 1
             else:
-                print("wierd symbol in cigar:", align[counter])
+                print("wierd symbol in cigar:", match_type)
             counter += 1
 
         while len(lines[-1]) < self.nuc_per_line:
@@ -1,5 +1,5 @@
 from .alignmentPrinter import *
-from random import choice
+from random import choices
 from MA import *
 
 def test_aligner():
@@ -7,9 +7,7 @@ def test_aligner():
     parameter_manager.set_selected("PacBio")
 
     # create a reference string
-    reference = ""
-    for _ in range(1000000):
-        reference += choice(['C', 'T', 'G'])
+    reference = "".join(choices(['C', 'T', 'G'], k=1000000))
 
     # create pack and fmd index from that string
     reference_pack = Pack()
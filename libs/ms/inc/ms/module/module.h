@@ -279,6 +279,8 @@ class BasePledge
          * active Python thread.
          * So, here we check if there is such a module and set the number of threads to one if
          * necessary. @todo
+         * Note: the python binding (VectorPledge.simultaneous_get) releases the GIL, so python modules
+         * acquire it in their trampoline and are executed one at a time.
          */
         // if( numThreads > 1 )
         //     for( std::shared_ptr<BasePledge> pPledge : vPledges )
@@ -299,76 +301,85 @@ class BasePledge
              * their next iteration.
              */
             std::atomic_bool bContinue( true );
-            // set up a threadpool
-            ThreadPool xPool( numThreads );
+            // executes the comp. graph of one pledge (repeatedly if there is a volatile module in the graph)
+            auto fWorker = [&callback, &bContinue, &xExceptionMutex, &sExceptionMessageFromWorker](
+                size_t uiTid, std::shared_ptr<BasePledge> pPledge ) {
+                assert( pPledge != nullptr );
 
-            // enqueue a task that executes the comp. graph for each thread in the pool.
-            for( std::shared_ptr<BasePledge> pPledge : vPledges )
-            {
-                xPool.enqueue(
-                    [&callback, &bContinue, &xExceptionMutex, &sExceptionMessageFromWorker /* , &xPool */](
-                        size_t uiTid, std::shared_ptr<BasePledge> pPledge ) {
-                        assert( pPledge != nullptr );
+                /*
+                 * Set bLoop = true if there is a volatile module in the graph.
+                 * This enables looping.
+                 * If bLoop is not set to true here we only compute the result once,
+                 * as all further computations would yield the same result.
+                 */
+                bool bLoop = pPledge->hasVolatile( );
 
+                // execute the loop if bLoop == true or do just one iteration otherwise.
+                do
+                {
+                    try
+                    {
                         /*
-                         * Set bLoop = true if there is a volatile module in the graph.
-                         * This enables looping.
-                         * If bLoop is not set to true here we only compute the result once,
-                         * as all further computations would yield the same result.
+                         * Execute one iteration of the comp. graph.
+                         * Then set bLoop to false if the execution returned pEoFContainer.
+                         * If bLoop is false already (due to there beeing no
+                         * volatile module) then leave it as false.
                          */
-                        bool bLoop = pPledge->hasVolatile( );
-
-                        // execute the loop if bLoop == true or do just one iteration otherwise.
-                        do
+                        bLoop &= pPledge->getAsBaseType( ) != nullptr;
+
+                        // this callback function can be used to set a progress bar
+                        // for example.
+                        if( uiTid == 0 )
+                            bContinue = callback( );
+                    } // try
+                    catch( const std::exception& rxException )
+                    {
+                        std::lock_guard<std::mutex> xExceptionGuard( xExceptionMutex );
+                        if( !sExceptionMessageFromWorker.empty( ) )
+                            std::cerr
+                                << "Drop exception (different thread threw already): " << rxException.what( )
+                                << std::endl;
+                        else
+                        {
+                            sExceptionMessageFromWorker = rxException.what( );
+                            bContinue = false;
+                        } // else
+                        return;
+                    } // catch
+                    catch( ... )
+                    {
+                        std::lock_guard<std::mutex> xExceptionGuard( xExceptionMutex );
+                        if( !sExceptionMessageFromWorker.empty( ) )
+                            std::cerr << "Drop unknown exception (different thread threw already)."
+                                      << std::endl;
+                        else
                         {
-                            try
-                            {
-                                /*
-                                 * Execute one iteration of the comp. graph.
-                                 * Then set bLoop to false if the execution returned pEoFContainer.
-                                 * If bLoop is false already (due to there beeing no
-                                 * volatile module) then leave it as false.
-                                 */
-                                bLoop &= pPledge->getAsBaseType( ) != nullptr;
-
-                                // this callback function can be used to set a progress bar
-                                // for example.
-                                if( uiTid == 0 )
-                                    bContinue = callback( );
-                            } // try
-                            catch( const std::exception& rxException )
-                            {
-                                std::lock_guard<std::mutex> xExceptionGuard( xExceptionMutex );
-                                if( !sExceptionMessageFromWorker.empty( ) )
-                                    std::cerr
-                                        << "Drop exception (different thread threw already): " << rxException.what( )
-                                        << std::endl;
-                                else
-                                {
-                                    sExceptionMessageFromWorker = rxException.what( );
-                                    bContinue = false;
-                                } // else
-                                return;
-                            } // catch
-                            catch( ... )
-                            {
-                                std::lock_guard<std::mutex> xExceptionGuard( xExceptionMutex );
-                                if( !sExceptionMessageFromWorker.empty( ) )
-                                    std::cerr << "Drop unknown exception (different thread threw already)."
-                                              << std::endl;
-                                else
-                                {
-                                    sExceptionMessageFromWorker = "Unknown exception";
-                                    bContinue = false;
-                                } // else
-                                return;
-                            } // catch
-                        } while( bLoop && bContinue );
-                    }, // lambda
-                    pPledge );
-            } // for
-            // wait for the pool to finish it's work
-        } // scope xPool
+                            sExceptionMessageFromWorker = "Unknown exception";
+                            bContinue = false;
+                        } // else
+                        return;
+                    } // catch
+                } while( bLoop && bContinue );
+            }; // lambda
+
+            /*
+             * With a single thread there is nothing to distribute:
+             * execute the pledges one after the other on the calling thread instead of setting up a threadpool.
+             */
+            if( numThreads == 1 )
+                for( std::shared_ptr<BasePledge> pPledge : vPledges )
+                    fWorker( 0, pPledge );
+            else
+            {
+                // set up a threadpool
+                ThreadPool xPool( numThreads );
+
+                // enqueue a task that executes the comp. graph for each thread in the pool.
+                for( std::shared_ptr<BasePledge> pPledge : vPledges )
+                    xPool.enqueue( fWorker, pPledge );
+                // wait for the pool to finish it's work
+            } // else
+        } // scope
 
         if( !sExceptionMessageFromWorker.empty( ) )
         {
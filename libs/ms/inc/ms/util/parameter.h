@@ -20,6 +20,9 @@ namespace fs = std::filesystem;
 #include <thread>
 #include <utility>
 #include <vector>
+#ifdef __linux__
+#include <sched.h>
+#endif
 
 /* Generic conversion of string to different value types.
  * (Specialized for some types)
@@ -984,6 +987,15 @@ class GeneralParameter : public ParameterSetBase
     size_t getNumThreads( ) const
     {
         size_t uiConcurency = std::thread::hardware_concurrency( );
+#ifdef __linux__
+        // only count the cores this process may run on (taskset, cgroup cpusets, ...)
+        cpu_set_t xCpuSet;
+        if( sched_getaffinity( 0, sizeof( xCpuSet ), &xCpuSet ) == 0 )
+            uiConcurency = CPU_COUNT( &xCpuSet );
+#endif
+        // hardware_concurrency may return 0 if the value is not computable
+        if( uiConcurency == 0 )
+            uiConcurency = 1;
         if( !this->pbUseMaxHardareConcurrency->get( ) )
         {
             uiConcurency = this->piNumberOfThreads->get( );
@@ -11,7 +11,7 @@ class AnalyzeRuntimes:
         self.counter = 0
 
     def register(self, name, pledge, average=False, func=lambda x: x.exec_time(),
-                 w_func=lambda x: x.wait_on_lock_time() if "wait_on_lock_time" in dir(x) else 0):
+                 w_func=lambda x: x.wait_on_lock_time() if hasattr(x, "wait_on_lock_time") else 0):
         if not name in self.times:
             self.times[name] = (self.counter, average, [])
             self.counter += 1
@@ -25,13 +25,18 @@ class AnalyzeRuntimes:
         if not out_file is None:
             out_file.write("runtime analysis:\n")
         data = []
-        total_runtime = 0 
+        # query the times of every pledge only once (each query goes through the bindings)
+        stage_times = {}
         for name, (counter, average, pledges) in self.times.items():
-            total_runtime += sum(func(pledge) for pledge, func, _ in pledges) / (len(pledges) if average else 1)
+            divisor = len(pledges) if average else 1
+            stage_times[name] = (sum(func(pledge) for pledge, func, _ in pledges) / divisor,
+                                 sum(w_func(pledge) for pledge, _, w_func in pledges) / divisor)
+        total_runtime = sum(seconds for seconds, _ in stage_times.values())
         max_before_dot = int(math.log10(max(1,total_runtime)))
         for name, (counter, average, pledges) in self.times.items():
-            wait_sec = round(sum(w_func(pledge) for pledge, _, w_func in pledges) / (len(pledges) if average else 1), 3)
-            seconds = round(sum(func(pledge) for pledge, func, _ in pledges) / (len(pledges) if average else 1), 3)
+            seconds, wait_sec = stage_times[name]
+            wait_sec = round(wait_sec, 3)
+            seconds = round(seconds, 3)
             percentage = (100*seconds)//total_runtime
             percentage_str = str(percentage) + "%"
             if percentage < 100:
@@ -41,7 +41,8 @@ void exportModuleClass( SubmoduleOrganizer& xOrganizer )
         .def( "append", &PyPledgeVector::append )
         .def( "get", &PyPledgeVector::get )
         .def( "clear", &PyPledgeVector::clear )
-        .def( "simultaneous_get", &PyPledgeVector::simultaneousGetPy );
+        // the workers only need the GIL for python modules, these acquire it themselves (PYBIND11_OVERLOAD)
+        .def( "simultaneous_get", &PyPledgeVector::simultaneousGetPy, py::call_guard<py::gil_scoped_release>( ) );
 
     py::implicitly_convertible<PyPledgeVector, BasePledge>( );
 
@@ -3,7 +3,8 @@ from MS import *
 from MA import *
 import datetime
 
-def compute_sv_jumps(parameter_set_manager, mm_index, pack, dataset_name, seq_ids=0, runtime_file=None):
+def compute_sv_jumps(parameter_set_manager, mm_index, pack, dataset_name, seq_ids=0, runtime_file=None,
+                     silent=False):
     #parameter_set_manager.by_name("Number of Threads").set(1)
     #parameter_set_manager.by_name("Use all Processor Cores").set(False)
     #assert parameter_set_manager.get_num_threads() == 1
@@ -12,6 +13,9 @@ def compute_sv_jumps(parameter_set_manager, mm_index, pack, dataset_name, seq_id
     def scope():
         single_con = DbConn(dataset_name)
 
+        # these modules are constructed once and shared by all parallel sub-graphs (and sequencer ids);
+        # only GetNucSeqFromSqlQuery (one read shard per worker) and UnLock (bound to the worker's query pledge)
+        # have to be created per worker below
         nuc_seq_fetcher = NucSeqFetcher(parameter_set_manager)
         lock_module = Lock(parameter_set_manager)
         seeding_module = MMFilteredSeeding(parameter_set_manager)
@@ -40,8 +44,9 @@ def compute_sv_jumps(parameter_set_manager, mm_index, pack, dataset_name, seq_id
             _seq_ids = seq_ids
 
         jobs = parameter_set_manager.get_num_threads()
+        hash_filter_table = HashFilterTable(single_con)
         for seq_id in _seq_ids:
-            mm_counter_container = HashFilterTable(single_con).get_counter(seq_id)
+            mm_counter_container = hash_filter_table.get_counter(seq_id)
             mm_counter = Pledge()
             mm_counter.set(mm_counter_container)
 
@@ -87,10 +92,12 @@ def compute_sv_jumps(parameter_set_manager, mm_index, pack, dataset_name, seq_id
 
             # drain all sources
             res.simultaneous_get(parameter_set_manager.get_num_threads())
+            pool = pool_pledge.get()
             for inserter in inserter_vec:
-                inserter.get().close(pool_pledge.get()) # @todo for some reason the destructor does not trigger automatically :(
+                inserter.get().close(pool) # @todo for some reason the destructor does not trigger automatically :(
 
-            analyze.analyze(runtime_file)
+            if not silent:
+                analyze.analyze(runtime_file)
 
         return get_jump_inserter.cpp_module.id
 
@@ -104,16 +111,19 @@ def compute_sv_jumps(parameter_set_manager, mm_index, pack, dataset_name, seq_id
 
     analyze = AnalyzeRuntimes()
 
-    print("num jumps:", jump_table.num_jumps(jump_id))
+    if not silent:
+        # counting the jumps is a query over the whole table; only do it if we print the number
+        print("num jumps:", jump_table.num_jumps(jump_id))
 
-    print("creating index...")
+        print("creating index...")
     start = datetime.datetime.now()
     jump_table.create_indices( jump_id )
     end = datetime.datetime.now()
     delta = end - start
     analyze.register("create_indices", delta.total_seconds(), False, lambda x: x)
-    print("created index")
-    analyze.analyze(runtime_file)
+    if not silent:
+        print("created index")
+        analyze.analyze(runtime_file)
 
     if not runtime_file is None:
         runtime_file.write("sv_jump_run_id is " + str(jump_id) + "\n")
@@ -97,8 +97,9 @@ def insert_reads(parameter_set, dataset_name, sequencer_name, file_queue, file_q
     # run the graph
     res.simultaneous_get(parameter_set.get_num_threads())
 
+    pool = pool_pledge.get()
     for inserter in inserter_vec:
-        inserter.get().close(pool_pledge.get()) # @todo for some reason the destructor does not trigger automatically :(
+        inserter.get().close(pool) # @todo for some reason the destructor does not trigger automatically :(
 
     HashFilterTable(single_con).insert_counter_set(get_read_inserter.cpp_module.id, hash_counter_container, coverage)
 
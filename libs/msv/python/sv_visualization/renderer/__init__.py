@@ -32,6 +32,7 @@ class Renderer():
         self.analyze = AnalyzeRuntimes()
         self.do_render_seeds = True
         self.do_compressed_seeds = 30
+        self.compressed_seeds = False # whether the last render_reads call compressed the seeds
         self.xs = 0
         self.ys = 0
         self.xe = 0
@@ -45,7 +46,7 @@ class Renderer():
         self.selected_seed_id = None
         self.selected_call_id = set()
         self.selected_jump_id = set()
-        self.read_plot_rects = {}  # dict of {"l": [], "b": [], "t": [], "r": [], "f":[], "s":[], "c":[]}
+        self.read_plot_rects = {}  # dict of read id -> _ReadPlotBuf
         self.cached_global_overview = None
         self.cached_overview_min_score = None
         self.cached_overview_max_render = None
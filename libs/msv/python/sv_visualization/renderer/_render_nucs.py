@@ -11,14 +11,12 @@ def render_nucs(self):
 
     nuc_seq = self.pack.extract_from_to(max(int(self.ys - self.h), 0),
                                         min(int(self.ye + self.h + 1), self.pack.unpacked_size_single_strand))
-    for y_add, nuc in enumerate(str(nuc_seq)):
-        append_nuc_type(l_plot_nucs, nuc, int(self.ys - self.h) + y_add, "p")
+    append_nuc_types(l_plot_nucs, str(nuc_seq), int(self.ys - self.h), "p")
 
     d_plot_nucs = {"p": [], "c": [], "i": []}
     nuc_seq = self.pack.extract_from_to(max(int(self.xs - self.w), 0),
                                         min(int(self.xe + self.w + 1), self.pack.unpacked_size_single_strand))
-    for x_add, nuc in enumerate(str(nuc_seq)):
-        append_nuc_type(d_plot_nucs, nuc, int(self.xs - self.w) + x_add, "p")
+    append_nuc_types(d_plot_nucs, str(nuc_seq), int(self.xs - self.w), "p")
 
     def callback():
         self.nuc_plot.left_nucs.data = l_plot_nucs
@@ -1,6 +1,7 @@
 from bokeh.models import TapTool, OpenURL
 from bokeh.plotting import ColumnDataSource
 import math
+import numpy as np
 from MA import *
 from MSV import *
 from .util import *
@@ -30,17 +31,20 @@ def render_overview(self):
         'i': []
     }
     if len(rect_vec) > 0:
-        max_ = max(*[r.c for r in rect_vec], 0)
+        # the call counts are read once and used for both the maximum and the colors
+        counts = np.fromiter((rect.c for rect in rect_vec), dtype=np.float64, count=len(rect_vec))
+        # counts are integers, so this only differs from counts.max() if all of them are 0
+        max_ = max(counts.max(), 1)
         names = self.pack.contigNames()
         for rect in rect_vec:
             cds["x"].append(rect.x)
             cds["y"].append(rect.y)
             cds["w"].append(rect.x + rect.w)
             cds["h"].append(rect.y + rect.h)
-            cds["c"].append(format(light_spec_approximation(rect.c/max_)))
             cds["f"].append(names[rect.i])
             cds["t"].append(names[rect.j])
             cds["i"].append(str(rect.c))
+        cds["c"] = format_vec(light_spec_approximation_vec(counts / max_))
 
     def callback():
         self.main_plot.overview_quad.data = cds
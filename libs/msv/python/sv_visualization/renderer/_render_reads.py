@@ -7,31 +7,98 @@ from MSV import *
 import math
 from .util import *
 import sys, traceback
+from operator import attrgetter
+import numpy as np
 
-def add_rectangle(self, seed_sample_size, read_id, rectangle, fill, read_ambiguous_reg_dict, end_column_len,
-                  category_counter, k_mer_size, use_dp, in_so_reseeding, layer):
-    
-    if rectangle.x_axis.size != 0:
-        seed_sample_size /= rectangle.x_axis.size
-    # if
-    self.read_plot_rects[read_id]["l"].append(rectangle.x_axis.start)
-    self.read_plot_rects[read_id]["b"].append(rectangle.y_axis.start)
-    self.read_plot_rects[read_id]["r"].append(rectangle.x_axis.start + rectangle.x_axis.size)
-    self.read_plot_rects[read_id]["t"].append(rectangle.y_axis.start + rectangle.y_axis.size)
-    self.read_plot_rects[read_id]["f"].append(fill)
-    self.read_plot_rects[read_id]["c"].append("lightgrey")
-    self.read_plot_rects[read_id]["s"].append(seed_sample_size)
-    self.read_plot_rects[read_id]["k"].append(k_mer_size)
-    self.read_plot_rects[read_id]["dp"].append(use_dp)
-    self.read_plot_rects[read_id]["i_soc"].append(in_so_reseeding)
-    self.read_plot_rects[read_id]["layer"].append(layer)
-    if use_dp and len(self.read_ids) <= self.do_compressed_seeds:
-        read_ambiguous_reg_dict["l"].append(rectangle.x_axis.start)
-        read_ambiguous_reg_dict["b"].append(category_counter - 0.5)
-        read_ambiguous_reg_dict["r"].append(rectangle.x_axis.start + rectangle.x_axis.size)
-        read_ambiguous_reg_dict["t"].append(category_counter + end_column_len - 0.5)
-        read_ambiguous_reg_dict["f"].append("lightgrey")
-        read_ambiguous_reg_dict["s"].append(seed_sample_size)
+# columns of the seed plot that are copied verbatim from the SeedInfo objects
+_SEED_ATTRS = [("r_id", "iReadId"), ("r_name", "sReadName"), ("size", "uiSize"), ("l", "uiL"), ("q", "uiQ"),
+               ("idx", "uiSeedOrderOnQuery"), ("layer", "uiLayer"), ("palindrome", "bParlindrome"),
+               ("overlapping", "bOverlapping"), ("in_soc_reseed", "bInSocReseed"), ("soc_nt", "soc_nt"),
+               ("soc_id", "soc_id"), ("max_filter", "uiMaxFilterCount"), ("min_filter", "uiMinFilterCount"),
+               ("f", "bOnForward"), ("category", "uiCategory"), ("center", "fCenter"), ("r", "uiR"),
+               ("x", "xX"), ("y", "xY")]
+_GETTER = attrgetter(*[attr for _, attr in _SEED_ATTRS])
+# outline colors of seeds by soc id (gray(6) without its first, black entry)
+_GRAY6_TAIL = gray(6)[1:6]
+# typed columns of the read plot rectangles, in the order expected by add_rectangle
+# (the color column "c" is constant and therefore kept as a plain list)
+_RECT_DTYPES = (("l", np.int64), ("b", np.int64), ("r", np.int64), ("t", np.int64), ("f", np.float64),
+                ("s", np.float64), ("k", np.int64), ("dp", np.bool_), ("i_soc", np.bool_), ("layer", np.int64))
+# typed columns of the ambiguous regions in the seed plot (the color column "f" is kept as a plain list)
+_AMBIGUOUS_REG_DTYPES = (("l", np.int64), ("b", np.float64), ("r", np.int64), ("t", np.float64), ("s", np.float64))
+
+class _ReadPlotBuf:
+    # rectangle columns of one read in the read plot;
+    # the typed columns are views into the buffers shared by all reads of a render (see _RECT_DTYPES)
+    __slots__ = ("l", "b", "r", "t", "f", "s", "k", "dp", "i_soc", "layer", "c")
+
+    def __init__(self, rect_bufs, start, end):
+        l_buf, b_buf, r_buf, t_buf, f_buf, s_buf, k_buf, dp_buf, i_soc_buf, layer_buf = rect_bufs
+        self.l = l_buf[start:end]
+        self.b = b_buf[start:end]
+        self.r = r_buf[start:end]
+        self.t = t_buf[start:end]
+        self.f = f_buf[start:end]
+        self.s = s_buf[start:end]
+        self.k = k_buf[start:end]
+        self.dp = dp_buf[start:end]
+        self.i_soc = i_soc_buf[start:end]
+        self.layer = layer_buf[start:end]
+        self.c = ["lightgrey"] * (end - start)
+
+    def data(self):
+        # the columns as dict, as expected by ColumnDataSource
+        return {key: getattr(self, key) for key in self.__slots__}
+
+def _rect_coords(rectangles):
+    # yields x start, x size, y start and y size of each rectangle as one flat sequence (for np.fromiter)
+    for rectangle in rectangles:
+        x_axis = rectangle.x_axis
+        y_axis = rectangle.y_axis
+        yield x_axis.start
+        yield x_axis.size
+        yield y_axis.start
+        yield y_axis.size
+
+def add_rectangle(self, r_i, rect_bufs, rect_idx, ambiguous_reg_bufs, ambiguous_reg_idx, compressed):
+    # writes all rectangles of r_i into rect_bufs (see _RECT_DTYPES) starting at rect_idx and, unless the seeds are
+    # compressed, the ones computed via dp into ambiguous_reg_bufs (see _AMBIGUOUS_REG_DTYPES) starting at
+    # ambiguous_reg_idx;
+    # returns the indices after the last written rectangle and the last written ambiguous region
+    l_buf, b_buf, r_buf, t_buf, f_buf, s_buf, k_buf, dp_buf, i_soc_buf, layer_buf = rect_bufs
+    rectangles = r_i.vRectangles
+    num_rects = len(rectangles)
+    end_idx = rect_idx + num_rects
+    coords = np.fromiter(_rect_coords(rectangles), dtype=np.int64, count=4*num_rects).reshape(num_rects, 4)
+    x_starts = coords[:, 0]
+    x_sizes = coords[:, 1]
+    x_ends = x_starts + x_sizes
+    # rectangles without width keep their undivided seed sample size
+    divisors = np.where(x_sizes != 0, x_sizes, 1)
+    seed_sample_sizes = np.fromiter(r_i.vRectangleReferenceAmbiguity, dtype=np.float64, count=num_rects) / divisors
+    use_dp = np.fromiter(r_i.vRectangleUsedDp, dtype=np.bool_, count=num_rects)
+
+    l_buf[rect_idx:end_idx] = x_starts
+    b_buf[rect_idx:end_idx] = coords[:, 2]
+    r_buf[rect_idx:end_idx] = x_ends
+    t_buf[rect_idx:end_idx] = coords[:, 2] + coords[:, 3]
+    f_buf[rect_idx:end_idx] = r_i.vRectangleFillPercentage
+    s_buf[rect_idx:end_idx] = seed_sample_sizes
+    k_buf[rect_idx:end_idx] = r_i.vRectangleKMerSize
+    dp_buf[rect_idx:end_idx] = use_dp
+    i_soc_buf[rect_idx:end_idx] = r_i.bInSoCReseeding
+    layer_buf[rect_idx:end_idx] = r_i.vRectangleLayers
+    ambiguous_reg_end_idx = ambiguous_reg_idx
+    if not compressed:
+        amb_l_buf, amb_b_buf, amb_r_buf, amb_t_buf, amb_s_buf = ambiguous_reg_bufs
+        ambiguous_reg_end_idx += int(np.count_nonzero(use_dp))
+        category_counter = r_i.uiCategory
+        amb_l_buf[ambiguous_reg_idx:ambiguous_reg_end_idx] = x_starts[use_dp]
+        amb_b_buf[ambiguous_reg_idx:ambiguous_reg_end_idx] = category_counter - 0.5
+        amb_r_buf[ambiguous_reg_idx:ambiguous_reg_end_idx] = x_ends[use_dp]
+        amb_t_buf[ambiguous_reg_idx:ambiguous_reg_end_idx] = category_counter + r_i.uiEndColumnSize - 0.5
+        amb_s_buf[ambiguous_reg_idx:ambiguous_reg_end_idx] = seed_sample_sizes[use_dp]
+    return end_idx, ambiguous_reg_end_idx
 
 def render_reads(self, render_all=False):
     read_dict = {
@@ -72,109 +139,116 @@ def render_reads(self, render_all=False):
     all_col_ids = []
     category_counter = 0
     end_column = None
+    # the rectangle columns of each read are views into the buffers of one render;
+    # drop the previous render's views so that their buffers can be freed
+    self.read_plot_rects = {}
 
+    # the read ids of the jumps (collected by render_jumps) plus the selected and forced reads
+    # (this is a set, not a frozenset, since seedDisplaysForReadIds only accepts python sets)
+    active_read_ids = set(self.read_ids)
     if not self.selected_read_id is None:
-        self.read_ids.add(self.selected_read_id)
-
-    for idx in self.widgets.get_forced_read_ids(self):
-        self.read_ids.add(idx)
+        active_read_ids.add(self.selected_read_id)
+    active_read_ids.update(self.widgets.get_forced_read_ids(self))
+    compressed = len(active_read_ids) > self.do_compressed_seeds
+    # remember how the seeds were rendered, so that seed_tap interprets the seed plot accordingly
+    self.compressed_seeds = compressed
 
-    if len(self.read_ids) > 0:
+    if len(active_read_ids) > 0:
         with self.measure("computing seeds"):
             if self.do_render_seeds:
                 info_ret = seedDisplaysForReadIds(self.params, 
-                                                        self.db_pool, self.read_ids, self.pack,
+                                                        self.db_pool, active_read_ids, self.pack,
                                                         self.mm_index, self.mm_counter,
-                                                        len(self.read_ids) > self.do_compressed_seeds, 
+                                                        compressed,
                                                         # 0 == infinite time for computing
                                                         3*self.get_max_num_ele()//10 if not render_all else 0)
 
         with self.measure("render seeds"):
             if (self.do_render_seeds and len(info_ret.vRet) < self.get_max_num_ele() * 10) or render_all:
-                for seed_info in info_ret.vRet:
-                    read_dict["r_id"].append(seed_info.iReadId)
-                    read_dict["r_name"].append(seed_info.sReadName)
-                    read_dict["size"].append(seed_info.uiSize)
-                    read_dict["l"].append(seed_info.uiL)
-                    read_dict["q"].append(seed_info.uiQ)
-                    read_dict["idx"].append(seed_info.uiSeedOrderOnQuery)
-                    read_dict["layer"].append(seed_info.uiLayer)
-                    read_dict["palindrome"].append(seed_info.bParlindrome)
-                    read_dict["overlapping"].append(seed_info.bOverlapping)
-                    read_dict["in_soc_reseed"].append(seed_info.bInSocReseed)
-                    read_dict["soc_nt"].append(seed_info.soc_nt)
-                    read_dict["soc_id"].append(seed_info.soc_id)
-                    read_dict["max_filter"].append(seed_info.uiMaxFilterCount)
-                    read_dict["min_filter"].append(seed_info.uiMinFilterCount)
-                    read_dict["f"].append(seed_info.bOnForward)
-                    read_dict["category"].append(seed_info.uiCategory)
-                    read_dict["center"].append(seed_info.fCenter)
-                    read_dict["r"].append(seed_info.uiR)
-                    read_dict["x"].append([*seed_info.xX])
-                    read_dict["y"].append([*seed_info.xY])
-                    read_dict["c"].append("lightgrey")
-                    read_dict["oc"].append(gray(6)[ (seed_info.soc_id % 5) + 1])
+                rows = list(map(_GETTER, info_ret.vRet))
+                for col_idx, (key, _) in enumerate(_SEED_ATTRS):
+                    read_dict[key] = [row[col_idx] for row in rows]
+                read_dict["x"] = [[*x] for x in read_dict["x"]]
+                read_dict["y"] = [[*y] for y in read_dict["y"]]
+                read_dict["c"] = ["lightgrey"] * len(rows)
+                read_dict["oc"] = [_GRAY6_TAIL[soc_id % 5] for soc_id in read_dict["soc_id"]]
 
+                rect_infos = info_ret.vRectangles
+                num_rects_by_r_id = {}
+                for r_i in rect_infos:
+                    num_rects_by_r_id[r_i.iReadId] = num_rects_by_r_id.get(r_i.iReadId, 0) + \
+                                                     len(r_i.vRectangleLayers)
+                num_rects = sum(num_rects_by_r_id.values())
+                # one buffer per column for all reads; each read owns a contiguous slice of them
+                rect_bufs = tuple(np.empty(num_rects, dtype=dtype) for _, dtype in _RECT_DTYPES)
+                # every rectangle can become at most one ambiguous region
+                ambiguous_reg_bufs = tuple(np.empty(num_rects, dtype=dtype) for _, dtype in _AMBIGUOUS_REG_DTYPES)
+                next_rect_idx = {}
+                rect_start = 0
                 for read in info_ret.vReads:
                     self.read_plot.nuc_plot.nucs_by_r_id[read.id] = {"p": [], "c": [], "i": []}
-                    self.read_plot_rects[read.id] = {"l": [], "b": [], "t": [], "r": [], "f":[], "s":[], "k":[],
-                                                    "c":[], "dp": [], "i_soc": [], "layer":[]}
-                    for y, nuc in enumerate(str(read)):
-                        append_nuc_type(self.read_plot.nuc_plot.nucs_by_r_id[read.id], nuc, y, "p")
+                    rect_end = rect_start + num_rects_by_r_id.get(read.id, 0)
+                    self.read_plot_rects[read.id] = _ReadPlotBuf(rect_bufs, rect_start, rect_end)
+                    next_rect_idx[read.id] = rect_start
+                    rect_start = rect_end
+                    append_nuc_types(self.read_plot.nuc_plot.nucs_by_r_id[read.id], str(read), 0, "p")
                 for x, y in info_ret.vReadsNCols:
                     read_id_n_cols[x] = y
-                col_ids = [*info_ret.vColIds]
-                all_col_ids = [*info_ret.vAllColIds]
-                for r_i in info_ret.vRectangles:
-                    for rectangle, layer, fill, seed_sample_size, k_mer_size, use_dp in zip(r_i.vRectangles,
-                                                                r_i.vRectangleLayers,
-                                                                r_i.vRectangleFillPercentage,
-                                                                r_i.vRectangleReferenceAmbiguity,
-                                                                r_i.vRectangleKMerSize,
-                                                                r_i.vRectangleUsedDp):
-                        self.add_rectangle(seed_sample_size, r_i.iReadId, rectangle, fill, read_ambiguous_reg_dict,
-                                        r_i.uiEndColumnSize, r_i.uiCategory, k_mer_size, use_dp, r_i.bInSoCReseeding,
-                                        layer)
+                # FixedTicker accepts numpy arrays, so the column ids are not boxed into python lists
+                col_ids = np.asarray(info_ret.vColIds, dtype=np.int64)
+                all_col_ids = np.asarray(info_ret.vAllColIds, dtype=np.int64)
+                num_ambiguous_regs = 0
+                for r_i in rect_infos:
+                    next_rect_idx[r_i.iReadId], num_ambiguous_regs = self.add_rectangle(r_i, rect_bufs,
+                                                                        next_rect_idx[r_i.iReadId],
+                                                                        ambiguous_reg_bufs, num_ambiguous_regs,
+                                                                        compressed)
+                for (key, _), buf in zip(_AMBIGUOUS_REG_DTYPES, ambiguous_reg_bufs):
+                    read_ambiguous_reg_dict[key] = buf[:num_ambiguous_regs]
+                read_ambiguous_reg_dict["f"] = ["lightgrey"] * num_ambiguous_regs
             else:
                 print("gave up rendering reads")
 
         def callback():
             with self.measure("rendering seeds"):
-                # render ambiguous regions on top and left
-                self.seed_plot.ambiguous_regions.data = read_ambiguous_reg_dict
-
-                # render seeds on top and left
-                self.seed_plot.seeds.data = read_dict
-                if self.seed_plot.left_plot.x_range.start == 0 and self.seed_plot.left_plot.x_range.end == 0:
-                    self.seed_plot.left_plot.x_range.start = -1
-                    self.seed_plot.left_plot.x_range.end = category_counter
-
-                if len(self.read_ids) <= self.do_compressed_seeds:
-                    self.seed_plot.left_plot.xaxis.ticker = FixedTicker(ticks=col_ids)
-                    self.seed_plot.bottom_plot.yaxis.ticker = FixedTicker(ticks=col_ids)
-                    self.seed_plot.left_plot.xaxis.formatter = FuncTickFormatter(
-                        args={"read_id_n_cols": read_id_n_cols},
-                        code="""
-                                if(!tick in read_id_n_cols)
-                                    return "";
-                                return read_id_n_cols[tick];
-                            """)
-                    self.seed_plot.bottom_plot.yaxis.formatter = FuncTickFormatter(
-                        args={"read_id_n_cols": read_id_n_cols},
-                        code="""
-                                if(!tick in read_id_n_cols)
-                                    return "";
-                                return read_id_n_cols[tick];
-                            """)
-                    self.seed_plot.left_plot.xaxis.axis_label = "Read Id"
-                    self.seed_plot.bottom_plot.yaxis.axis_label = "Read Id"
-                else:
-                    self.seed_plot.left_plot.xaxis.ticker = []
-                    self.seed_plot.left_plot.xaxis.axis_label = "compressed seeds"
-                    self.seed_plot.bottom_plot.yaxis.ticker = []
-                    self.seed_plot.bottom_plot.yaxis.axis_label = "compressed seeds"
-                self.seed_plot.left_plot.xgrid.ticker = FixedTicker(ticks=all_col_ids)
-                self.seed_plot.bottom_plot.ygrid.ticker = FixedTicker(ticks=all_col_ids)
-
-                self.seed_plot.update_selection(self)
+                # send all of the changes below to the browser as one combined update
+                self.curdoc.hold("combine")
+                try:
+                    # render ambiguous regions on top and left
+                    self.seed_plot.ambiguous_regions.data = read_ambiguous_reg_dict
+
+                    # render seeds on top and left
+                    self.seed_plot.seeds.data = read_dict
+                    if self.seed_plot.left_plot.x_range.start == 0 and self.seed_plot.left_plot.x_range.end == 0:
+                        self.seed_plot.left_plot.x_range.start = -1
+                        self.seed_plot.left_plot.x_range.end = category_counter
+
+                    # the left and bottom plot share their tickers and formatters
+                    if not compressed:
+                        col_ticker = FixedTicker(ticks=col_ids)
+                        col_formatter = FuncTickFormatter(
+                            args={"read_id_n_cols": read_id_n_cols},
+                            code="""
+                                    if(!tick in read_id_n_cols)
+                                        return "";
+                                    return read_id_n_cols[tick];
+                                """)
+                        self.seed_plot.left_plot.xaxis.ticker = col_ticker
+                        self.seed_plot.bottom_plot.yaxis.ticker = col_ticker
+                        self.seed_plot.left_plot.xaxis.formatter = col_formatter
+                        self.seed_plot.bottom_plot.yaxis.formatter = col_formatter
+                        self.seed_plot.left_plot.xaxis.axis_label = "Read Id"
+                        self.seed_plot.bottom_plot.yaxis.axis_label = "Read Id"
+                    else:
+                        self.seed_plot.left_plot.xaxis.ticker = []
+                        self.seed_plot.left_plot.xaxis.axis_label = "compressed seeds"
+                        self.seed_plot.bottom_plot.yaxis.ticker = []
+                        self.seed_plot.bottom_plot.yaxis.axis_label = "compressed seeds"
+                    all_col_ticker = FixedTicker(ticks=all_col_ids)
+                    self.seed_plot.left_plot.xgrid.ticker = all_col_ticker
+                    self.seed_plot.bottom_plot.ygrid.ticker = all_col_ticker
+
+                    self.seed_plot.update_selection(self)
+                finally:
+                    self.curdoc.unhold()
         self.do_callback(callback)
@@ -33,6 +33,8 @@ def setup(self):
         self.calls_from_db = SvCallsFromDb(self.db_conn_3)
         self.count_calls_from_db = SvCallsFromDb(self.db_conn_4)
         self.calls_from_db_gt = SvCallsFromDb(self.db_conn_5)
+        # the cached overview was queried from the previous dataset
+        self.cached_global_overview = None
 
         # chromosome lines
         xs = [*self.pack.contigStarts(), self.pack.unpacked_size_single_strand]
@@ -1,47 +1,26 @@
 from bokeh.palettes import Plasma, Plasma256
+import numpy as np
 
-def light_spec_approximation(x):
-    #map input [0, 1] to wavelength [350, 645]
-    w = 370 + x * (645-370)
-    r = 0.0
-    g = 0.0
-    b = 0.0
-    if w < 440:
-        r = -(w - 440.) / (440. - 380.)
-        b = 1.0
-    elif w >= 440 and w < 490:
-        g = (w - 440.) / (490. - 440.)
-        b = 1.0
-    elif w >= 490 and w < 510:
-        g = 1.0
-        b = -(w - 510.) / (510. - 490.)
-    elif w >= 510 and w < 580:
-        r = (w - 510.) / (580. - 510.)
-        g = 1.0
-    elif w >= 580 and w < 645:
-        r = 1.0
-        g = -(w - 645.) / (645. - 580.)
-    elif w >= 645:
-        r = 1.0
+def light_spec_approximation_vec(x):
+    #map input [0, 1] to wavelength [350, 645]; works on whole arrays and returns the arrays (r, g, b)
+    w = 370 + np.asarray(x, dtype=np.float64) * (645-370)
+    conditions = [w < 440, w < 490, w < 510, w < 580, w < 645, w >= 645]
+    r = np.select(conditions, [-(w - 440.) / (440. - 380.), 0.0, 0.0, (w - 510.) / (580. - 510.), 1.0, 1.0], 0.0)
+    g = np.select(conditions, [0.0, (w - 440.) / (490. - 440.), 1.0, 1.0, -(w - 645.) / (645. - 580.), 0.0], 0.0)
+    b = np.select(conditions, [1.0, 1.0, -(w - 510.) / (510. - 490.), 0.0, 0.0, 0.0], 0.0)
 
     #intensity
-    i = 1.0
-    if w > 650:
-        i = .3 + .7*(780-w)/(780-650)
-    elif w < 420:
-        i = .3 + .7*(w-380)/(420-380)
+    i = np.select([w > 650, w < 420], [.3 + .7*(780-w)/(780-650), .3 + .7*(w-380)/(420-380)], 1.0)
 
     #gamma
     m = .8
 
     return (i*r**m, i*g**m, i*b**m)
 
-def format(rgb):
-        def clamp(x):
-            return max(0, min(x, 255))
-        red, green, blue = rgb
-        return "#{0:02x}{1:02x}{2:02x}".format(clamp(int(red * 255)), clamp(int(green * 255)),
-                                               clamp(int(blue * 255)))
+def format_vec(rgb):
+    # turn the arrays (r, g, b) into a list of hex color strings
+    channels = np.clip((np.stack(rgb, axis=-1) * 255).astype(np.int64), 0, 255)
+    return ["#{0:02x}{1:02x}{2:02x}".format(*c) for c in channels.tolist()]
 
 def html_file(name):
     with open("html/" + name + ".html", "r") as html_file:
@@ -64,23 +43,23 @@ def decode(o):
     else:
         return o
 
-def append_nuc_type(dict_, nuc, pos, pos_key):
-    if nuc == "A" or nuc == "a":
-        dict_["c"].append("blue")
-        dict_["i"].append("A @" + str(pos))
-    elif nuc == "C" or nuc == "c":
-        dict_["c"].append("red")
-        dict_["i"].append("C @" + str(pos))
-    elif nuc == "G" or nuc == "g":
-        dict_["c"].append("green")
-        dict_["i"].append("G @" + str(pos))
-    elif nuc == "T" or nuc == "t":
-        dict_["c"].append("yellow")
-        dict_["i"].append("T @" + str(pos))
-    else:
-        dict_["c"].append("lightgray")
-        dict_["i"].append(nuc + " @" + str(pos))
-    dict_[pos_key].append(pos + 0.5)
+# lookup tables for append_nuc_types: color index and hover label per ascii character
+_NUC_COLORS = np.array(["lightgray", "blue", "red", "green", "yellow"], dtype=object)
+_NUC_LUT = np.zeros(256, dtype=np.uint8)
+_NUC_LABELS = np.array([chr(x) for x in range(256)], dtype=object)
+for _color_idx, _nuc in enumerate("ACGT"):
+    _NUC_LUT[ord(_nuc)] = _color_idx + 1
+    _NUC_LUT[ord(_nuc.lower())] = _color_idx + 1
+    _NUC_LABELS[ord(_nuc.lower())] = _nuc
+
+def append_nuc_types(dict_, seq, start_pos, pos_key):
+    # appends color (A blue, C red, G green, T yellow, other lightgray), hover label and position + 0.5
+    # for each nucleotide of seq, starting at start_pos; the sequence is classified in one numpy pass
+    arr = np.frombuffer(seq.encode("ascii"), dtype=np.uint8)
+    positions = range(start_pos, start_pos + len(arr))
+    dict_["c"].extend(_NUC_COLORS[_NUC_LUT[arr]].tolist())
+    dict_["i"].extend([nuc + " @" + str(pos) for nuc, pos in zip(_NUC_LABELS[arr].tolist(), positions)])
+    dict_[pos_key].extend((np.arange(start_pos, start_pos + len(arr)) + 0.5).tolist())
 
 def add_seed(seed, read_dict, max_seed_size, end_column, all_col_ids, category_counter, palindrome, layer,
              read_id, idx, r_name):
@@ -207,7 +207,8 @@ void SvJumpsFromSeeds::computeSeeds( geom::Rectangle<nucSeqIndex>& xArea, std::s
         return;
     } // if
     auto pRef = pRefSeq->vExtract( xArea.xXAxis.start( ), xArea.xXAxis.end( ) );
-    auto pRefRevComp = pRefSeq->vExtract( xArea.xXAxis.start( ), xArea.xXAxis.end( ) );
+    // copy instead of extracting the same section from the pack a second time
+    auto pRefRevComp = std::make_shared<NucSeq>( *pRef );
     pRefRevComp->vReverseAll( );
     pRefRevComp->vSwitchAllBasePairsToComplement( );
     // @todo this is inefficient:
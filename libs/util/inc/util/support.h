@@ -52,6 +52,13 @@ bool DLL_PORT(util) fileExists( const std::string& rsFile );
 
 void DLL_PORT(util) makeDir( const std::string& rsFile );
 
+/* Asks the operating system to start reading the complete file into the page cache, so that subsequent
+ * reads of the file (e.g. from a std::ifstream) are less likely to wait for the disk.
+ * This only hints the kernel; reading is not guaranteed to be asynchronous (the call itself may block
+ * while the readahead is submitted). Does nothing on non-Linux systems or if the file cannot be opened.
+ */
+void DLL_PORT(util) prefetchFile( const std::string& rsFile );
+
 /* Constructs the full filename for a prefix, suffix combination.
  */
 std::string DLL_PORT(util) fullFileName( const char* pcFileNamePrefix, const char* pcSuffix );
@@ -7,6 +7,11 @@
 #include <direct.h>
 #endif
 
+#ifdef __linux__
+#include <fcntl.h>
+#include <unistd.h>
+#endif
+
 
 #include <cctype>
 #include <cerrno>
@@ -79,6 +84,18 @@ void makeDir( const std::string& rsFile )
     } // if
 } // function
 
+void prefetchFile( const std::string& rsFile )
+{
+#ifdef __linux__
+    int iFd = open( rsFile.c_str( ), O_RDONLY );
+    if( iFd == -1 )
+        return;
+    // readahead of the whole file; the pages stay in the page cache after closing the descriptor
+    posix_fadvise( iFd, 0, 0, POSIX_FADV_WILLNEED );
+    close( iFd );
+#endif
+} // function
+
 bool /* DLL_PORT(util) */ is_big_endian( )
 {
     union